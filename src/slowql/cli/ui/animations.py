@@ -11,11 +11,12 @@ Provides cinematic cyberpunk animations for CLI experience:
 
 from __future__ import annotations
 
+import bisect
 import contextlib
 import random
 import shutil
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from rich import box
 from rich.align import Align
@@ -42,6 +43,16 @@ except ImportError:
 class MatrixRain:
     """Full-window Matrix rain intro with integrated 3D Pixel-Logo."""
 
+    # Gradient zone upper bounds (as a fraction of logo width) and their colors
+    LOGO_COLOR_BOUNDS: ClassVar[tuple[float, ...]] = (0.1, 0.35, 0.6, 0.8)
+    LOGO_COLORS: ClassVar[tuple[str, ...]] = (
+        "bold cyan",  # The Arrow area
+        "bold deep_sky_blue1",  # S-L
+        "bold medium_purple1",  # O-W
+        "bold magenta",  # Q
+        "bold hot_pink",  # L
+    )
+
     def __init__(self) -> None:
         self.console: Console = Console()
         size = shutil.get_terminal_size()
@@ -80,17 +91,7 @@ class MatrixRain:
         """
         # Relative position 0.0 to 1.0 within the logo
         ratio = x_pos / max(1, total_width)
-
-        if ratio < 0.1:  # The Arrow area
-            return "bold cyan"
-        elif ratio < 0.35:  # S-L
-            return "bold deep_sky_blue1"
-        elif ratio < 0.6:  # O-W
-            return "bold medium_purple1"
-        elif ratio < 0.8:  # Q
-            return "bold magenta"
-        else:  # L
-            return "bold hot_pink"
+        return self.LOGO_COLORS[bisect.bisect_right(self.LOGO_COLOR_BOUNDS, ratio)]
 
     def _get_logo_position(self) -> tuple[int, int, int]:
         """Calculate the top-left position and width of the logo."""
@@ -188,8 +189,9 @@ class MatrixRain:
         # Padding
         self.console.print("\n" * 2)
 
-        # Print Static Logo with Gradient
+        # Print Static Logo with Gradient, built up front and rendered in one pass
         logo_width = max(len(line) for line in self.logo_ascii)
+        logo_lines: list[Renderable] = []
         for line in self.logo_ascii:
             text = Text()
             for i, char in enumerate(line):
@@ -198,9 +200,10 @@ class MatrixRain:
                 if char in ["▓", "▒", "░"]:
                     color = color.replace("bold", "dim")
                 text.append(char, style=color)
-            self.console.print(Align.center(text))
+            logo_lines.append(Align.center(text))
+        logo_lines.append(Align.center(self.subtitle, style="bold cyan"))
 
-        self.console.print(Align.center(self.subtitle, style="bold cyan"))
+        self.console.print(Group(*logo_lines))
         self.console.print()
 
         time.sleep(0.5)
@@ -658,9 +661,13 @@ class AnimatedAnalyzer:
     def glitch_transition(self, duration: float = 0.2) -> None:
         """Glitch effect between sections."""
         chars: str = "░▒▓█▀▄━│─/╲"
-        for _ in range(int(duration * 10)):
-            glitch_line: str = "".join(random.choice(chars) for _ in range(80))
-            self.console.print(f"[{random.choice(self.gradient_colors)}]{glitch_line}[/]", end="\r")
+        # Build every frame before the timed loop, so pacing is only print + sleep
+        frames: list[Text] = [
+            Text("".join(random.choices(chars, k=80)), style=random.choice(self.gradient_colors))
+            for _ in range(int(duration * 10))
+        ]
+        for frame in frames:
+            self.console.print(frame, end="\r")
             time.sleep(0.02)
         self.console.print(" " * 80, end="\r")
 
@@ -5,8 +5,19 @@ SQL statement splitter that preserves source anchoring information.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
+# Whitespace and comments before a statement. An unterminated block comment
+# runs to the end of the input.
+_LEADING_RE = re.compile(r"(?:\s+|--[^\n]*\n?|/\*(?:.*?\*/|.*))*", re.DOTALL)
+
+# The tokens that can change the scanner's state inside a statement: quotes,
+# comment openers, dollar quotes, ';' and words (which may be BEGIN/CASE/END).
+# ``\w`` matches exactly ``str.isalnum()`` plus '_'; a word never starts with
+# a digit or '_'.
+_STATEMENT_TOKEN_RE = re.compile(r"['\"`;$]|--|/\*|[^\W\d_]\w*")
+
 
 @dataclass(frozen=True, slots=True)
 class StatementSlice:
@@ -47,9 +58,33 @@ class SourceSplitter:
         if not sql:
             return []
 
+        n = len(sql)
+
+        # Fast path: without any ';' the input can only be one statement, so
+        # skip the character-by-character scan for quotes, comments and blocks.
+        if ";" not in sql:
+            start = self._find_first_token(sql, 0, n)
+            raw = sql[start:].rstrip()
+            if not raw:
+                return []
+            line, line_start = self._advance_location(sql, 0, start, 1, 0)
+            return [StatementSlice(
+                raw=raw,
+                start_offset=start,
+                end_offset=start + len(raw),
+                line=line,
+                column=start - line_start + 1
+            )]
+
         slices: list[StatementSlice] = []
         i = 0
-        n = len(sql)
+
+        # Running location state: line number and offset of the start of that
+        # line, valid up to ``loc_offset``. Advancing it only scans the text
+        # between consecutive statements instead of the whole prefix.
+        loc_offset = 0
+        line = 1
+        line_start = 0
 
         while i < n:
             # 1. Skip leading whitespace and comments to find the true statement start
@@ -68,13 +103,16 @@ class SourceSplitter:
                 raw = raw_trimmed
 
             if raw:
-                line, column = self._get_location(sql, stmt_sql_start)
+                line, line_start = self._advance_location(
+                    sql, loc_offset, stmt_sql_start, line, line_start
+                )
+                loc_offset = stmt_sql_start
                 slices.append(StatementSlice(
                     raw=raw,
                     start_offset=stmt_sql_start,
                     end_offset=stmt_end,
                     line=line,
-                    column=column
+                    column=stmt_sql_start - line_start + 1
                 ))
 
             i = stmt_end
@@ -94,87 +132,65 @@ class SourceSplitter:
         block_depth = 0
         start_block_keywords = {"BEGIN", "CASE"}
 
-        while j < n:
-            char = sql[j]
-            if char in ("'", '"', '`'):
-                j = self._skip_quoted(sql, j, n, char)
-            elif char == '-' and j + 1 < n and sql[j + 1] == '-':
+        # Jump straight to the next character that matters instead of
+        # stepping over identifiers, numbers and operators one at a time.
+        while (match := _STATEMENT_TOKEN_RE.search(sql, j, n)) is not None:
+            j = match.start()
+            token = match.group()
+            if token in ("'", '"', '`'):
+                j = self._skip_quoted(sql, j, n, token)
+            elif token == "--":
                 j = self._skip_line_comment(sql, j, n)
-            elif char == '/' and j + 1 < n and sql[j + 1] == '*':
+            elif token == "/*":
                 j = self._skip_block_comment(sql, j, n)
-            elif char == '$' and j + 1 < n:
+            elif token == "$":
                 j = self._skip_dollar_quoted(sql, j, n)
-            elif char.isalpha():
-                word = ""
-                k = j
-                while k < n and (sql[k].isalnum() or sql[k] == '_'):
-                    word += sql[k]
-                    k += 1
-
-                upper_word = word.upper()
+            elif token == ";":
+                if block_depth == 0:
+                    return j + 1, True
+                j += 1
+            elif token[0].isalpha():
+                upper_word = token.upper()
                 if upper_word in start_block_keywords:
                     block_depth += 1
                 elif upper_word == "END":
                     block_depth = max(0, block_depth - 1)
-                j = k
-            elif char == ';' and block_depth == 0:
-                return j + 1, True
+                j = match.end()
             else:
                 j += 1
 
-        return j, False
+        return n, False
 
     def _find_first_token(self, sql: str, start: int, n: int) -> int:
         """Find the index of the first character that is not whitespace or part of a comment."""
-        i = start
-        while i < n:
-            char = sql[i]
-            if char.isspace():
-                i += 1
-            elif char == '-' and i + 1 < n and sql[i + 1] == '-':
-                i = self._skip_line_comment(sql, i, n)
-            elif char == '/' and i + 1 < n and sql[i + 1] == '*':
-                i = self._skip_block_comment(sql, i, n)
-            else:
-                return i
-        return n
-
-    def _get_location(self, sql: str, offset: int) -> tuple[int, int]:
-        prefix = sql[:offset]
-        line = prefix.count('\n') + 1
-        last_newline = prefix.rfind('\n')
-        if last_newline == -1:
-            column = offset + 1
-        else:
-            column = offset - last_newline
-        return line, column
+        return _LEADING_RE.match(sql, start, n).end()  # type: ignore[union-attr]
+
+    def _advance_location(
+        self, sql: str, start: int, end: int, line: int, line_start: int
+    ) -> tuple[int, int]:
+        """Advance (line, line_start) from offset ``start`` to offset ``end``."""
+        newlines = sql.count('\n', start, end)
+        if newlines:
+            line += newlines
+            line_start = sql.rfind('\n', start, end) + 1
+        return line, line_start
 
     def _skip_quoted(self, sql: str, start: int, n: int, quote: str) -> int:
-        i = start + 1
-        while i < n:
-            if sql[i] == quote:
-                if i + 1 < n and sql[i + 1] == quote:
-                    i += 2
-                    continue
-                return i + 1
-            i += 1
+        i = sql.find(quote, start + 1, n)
+        while i != -1:
+            if i + 1 < n and sql[i + 1] == quote:
+                i = sql.find(quote, i + 2, n)
+                continue
+            return i + 1
         return n
 
     def _skip_line_comment(self, sql: str, start: int, n: int) -> int:
-        i = start + 2
-        while i < n:
-            if sql[i] == '\n':
-                return i + 1
-            i += 1
-        return n
+        i = sql.find('\n', start + 2, n)
+        return n if i == -1 else i + 1
 
     def _skip_block_comment(self, sql: str, start: int, n: int) -> int:
-        i = start + 2
-        while i < n:
-            if sql[i] == '*' and i + 1 < n and sql[i + 1] == '/':
-                return i + 2
-            i += 1
-        return n
+        i = sql.find('*/', start + 2, n)
+        return n if i == -1 else i + 2
 
     def _skip_dollar_quoted(self, sql: str, start: int, n: int) -> int:
         end_dollar = sql.find('$', start + 1)
@@ -8,6 +8,8 @@ the sqlglot library. It can auto-detect dialects or use a specified one.
 
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import re
 from typing import TYPE_CHECKING, Any, ClassVar
 
@@ -18,12 +20,67 @@ from sqlglot.errors import ParseError as SqlglotParseError
 from slowql.core.exceptions import ParseError, UnsupportedDialectError
 from slowql.core.models import Location, Query
 from slowql.parser.base import BaseParser
-from slowql.parser.source_splitter import SourceSplitter
+from slowql.parser.source_splitter import SourceSplitter, StatementSlice
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 
+# Exact-type dispatch for UniversalParser._get_query_type_from_ast.
+_AST_QUERY_TYPES: dict[type[exp.Expression], str] = {
+    exp.Select: "SELECT",
+    exp.Insert: "INSERT",
+    exp.Update: "UPDATE",
+    exp.Delete: "DELETE",
+    exp.Merge: "MERGE",
+    exp.Create: "CREATE",
+    exp.Alter: "ALTER",
+    exp.Drop: "DROP",
+}
+# Node classes that are missing or named differently across sqlglot versions.
+for _node_name, _query_type in (
+    ("Grant", "GRANT"),
+    ("Truncate", "TRUNCATE"),
+    ("TruncateTable", "TRUNCATE"),
+):
+    _node_type = getattr(exp, _node_name, None)
+    if _node_type is not None:
+        _AST_QUERY_TYPES[_node_type] = _query_type
+
+# Leading keyword of a raw statement, skipping whitespace and comments.
+# Possessive quantifiers keep a failed match from backtracking through comments.
+_FIRST_KEYWORD_RE = re.compile(r"(?:\s|--[^\n]*+|/\*.*?\*/)*+([A-Za-z]+)", re.DOTALL)
+
+# Statement types UniversalParser.get_query_type recognizes without parsing.
+_RAW_QUERY_TYPES = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP"})
+
+
+@functools.cache
+def _sqlglot_dialect_names() -> frozenset[str]:
+    """Lower-cased names of the dialects known to sqlglot, computed once."""
+    # sqlglot.dialects.DIALECTS contains TitleCase strings like 'Postgres'
+    return frozenset(d.lower() for d in sqlglot.dialects.DIALECTS)
+
+
+# Parsers reused by _parse_statement_worker within one worker process.
+_worker_parsers: dict[str | None, UniversalParser] = {}
+
+
+def _parse_statement_worker(payload: dict[str, Any]) -> Query:
+    """Top-level worker function for parallel statement parsing."""
+    default_dialect = payload["default_dialect"]
+    parser = _worker_parsers.get(default_dialect)
+    if parser is None:
+        parser = _worker_parsers[default_dialect] = UniversalParser(default_dialect)
+    return parser._parse_statement(
+        payload["stmt"],
+        payload["index"],
+        raw=payload["raw"],
+        dialect=payload["dialect"],
+        file_path=payload["file_path"],
+    )
+
+
 class UniversalParser(BaseParser):
     """
     A universal SQL parser powered by sqlglot.
@@ -44,6 +101,13 @@ class UniversalParser(BaseParser):
         "snowflake": [r"\bLATERAL\s+FLATTEN\b"],
     }
 
+    # Minimum number of statements before parse() fans out to worker processes;
+    # below this, process start-up and pickling outweigh the parsing work.
+    PARALLEL_PARSE_THRESHOLD: ClassVar[int] = 16
+
+    # User-facing dialect names that sqlglot spells differently.
+    DIALECT_ALIASES: ClassVar[dict[str, str]] = {"postgresql": "postgres", "mssql": "tsql"}
+
     def __init__(self, dialect: str | None = None) -> None:
         """
         Initialize the universal parser.
@@ -55,14 +119,9 @@ class UniversalParser(BaseParser):
             UnsupportedDialectError: If the dialect is not supported by sqlglot.
         """
         # Normalize dialect for sqlglot (which uses 'postgres', 'tsql', etc.)
-        if dialect == "postgresql":
-            dialect = "postgres"
-        elif dialect == "mssql":
-            dialect = "tsql"
         if dialect:
-            # sqlglot.dialects.DIALECTS contains TitleCase strings like 'Postgres'
-            sqlglot_dialects = [d.lower() for d in sqlglot.dialects.DIALECTS]
-            if dialect.lower() not in sqlglot_dialects:
+            dialect = self.DIALECT_ALIASES.get(dialect, dialect)
+            if dialect.lower() not in _sqlglot_dialect_names():
                 raise UnsupportedDialectError(dialect)
         self.default_dialect = dialect
 
@@ -90,7 +149,12 @@ class UniversalParser(BaseParser):
         return sql
 
     def parse(
-        self, sql: str, *, dialect: str | None = None, file_path: str | Path | None = None
+        self,
+        sql: str,
+        *,
+        dialect: str | None = None,
+        file_path: str | Path | None = None,
+        workers: int | None = None,
     ) -> list[Query]:
         """
         Parse a SQL string into a list of Query objects.
@@ -99,6 +163,9 @@ class UniversalParser(BaseParser):
             sql: The SQL string to parse.
             dialect: The SQL dialect to use.
             file_path: Optional path to the source file for location tracking.
+            workers: Number of worker processes to parse statements with. Only
+                used when greater than 1 and the input has at least
+                PARALLEL_PARSE_THRESHOLD statements; otherwise parsing is serial.
 
         Returns:
             A list of parsed Query objects.
@@ -106,69 +173,131 @@ class UniversalParser(BaseParser):
         Raises:
             ParseError: If parsing fails.
         """
+        statements = self._split_source(sql)
+        dialect = self._normalize_dialect(dialect)
+
+        if workers and workers > 1 and len(statements) >= self.PARALLEL_PARSE_THRESHOLD:
+            return self._parse_parallel(
+                sql, statements, dialect=dialect, file_path=file_path, workers=workers
+            )
+
+        return [
+            self._parse_statement(
+                stmt,
+                i,
+                raw=sql[stmt.start_offset : stmt.end_offset],
+                dialect=dialect,
+                file_path=file_path,
+            )
+            for i, stmt in enumerate(statements)
+        ]
+
+    def _parse_parallel(
+        self,
+        sql: str,
+        statements: list[StatementSlice],
+        *,
+        dialect: str | None,
+        file_path: str | Path | None,
+        workers: int,
+    ) -> list[Query]:
+        """Parse statements across a process pool, preserving statement order."""
+        # sqlglot parsing is pure Python and CPU-bound, so threads would be
+        # serialized by the GIL; processes are required for a real speedup.
+        payloads = [
+            {
+                "default_dialect": self.default_dialect,
+                "stmt": stmt,
+                "index": i,
+                "raw": sql[stmt.start_offset : stmt.end_offset],
+                "dialect": dialect,
+                "file_path": file_path,
+            }
+            for i, stmt in enumerate(statements)
+        ]
+        max_workers = min(workers, len(payloads))
+        chunksize = max(1, len(payloads) // (max_workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_parse_statement_worker, payloads, chunksize=chunksize))
+
+    def _split_source(self, sql: str) -> list[StatementSlice]:
+        """Strip Jinja templating and split the source into statement slices."""
         stripped_sql = self._strip_jinja(sql)
         splitter = SourceSplitter()
         try:
-            statements = splitter.split(stripped_sql)
+            return splitter.split(stripped_sql)
         except Exception as e:
             raise ParseError(
                 "An unexpected error occurred during SQL splitting.", details=str(e)
             ) from e
-        queries = []
 
-        # Normalize dialect for sqlglot
-        if dialect == "postgresql":
-            dialect = "postgres"
-        elif dialect == "mssql":
-            dialect = "tsql"
+    def _normalize_dialect(self, dialect: str | None) -> str | None:
+        """Map user-facing dialect aliases to sqlglot dialect names."""
+        # Callers almost always pass nothing or the parser's own dialect.
+        if dialect is None or dialect == self.default_dialect:
+            return dialect
+        return self.DIALECT_ALIASES.get(dialect, dialect)
+
+    def _parse_statement(
+        self,
+        stmt: StatementSlice,
+        index: int,
+        *,
+        raw: str,
+        dialect: str | None,
+        file_path: str | Path | None,
+    ) -> Query:
+        """
+        Parse one statement slice into a Query.
 
-        for i, stmt in enumerate(statements):
-            try:
-                # Use provided dialect, then default, then auto-detect
-                effective_dialect = (
-                    dialect or self.default_dialect or self.detect_dialect(stmt.raw)
-                )
-
-
-                # Get the true unstripped raw from the original sql
-                true_raw = sql[stmt.start_offset : stmt.end_offset]
-
-                # Parse the single statement (stripped for safety)
-                parsed = sqlglot.parse_one(
-                    stmt.raw,
-                    dialect=effective_dialect,
-                    error_level=sqlglot.errors.ErrorLevel.WARN,
-                )
-
-                # Create Query object
-                query = Query(
-                    raw=true_raw,
-                    normalized=self.normalize(parsed, dialect=effective_dialect),
-                    dialect=effective_dialect or "unknown",
-                    location=Location(
-                        line=stmt.line,
-                        column=stmt.column,
-                        file=str(file_path) if file_path else None,
-                        query_index=i,
-                    ),
-                    start_offset=stmt.start_offset,
-                    end_offset=stmt.end_offset,
-                    ast=parsed,
-                    tables=tuple(self._extract_tables_from_ast(parsed)),
-                    columns=tuple(self._extract_columns_from_ast(parsed)),
-                    query_type=self._get_query_type_from_ast(parsed),
-                    is_ddl=self._is_ddl(parsed),
-                )
-                queries.append(query)
-
-            except SqlglotParseError as e:
-                raise ParseError(
-                    f"Failed to parse SQL statement: {e}",
-                    sql=stmt.raw,
-                    details=str(e),
-                ) from e
-
-        return queries
+        Args:
+            stmt: The statement slice produced by the splitter.
+            index: Position of the statement within the source.
+            raw: The statement text taken from the original (unstripped) SQL.
+            dialect: Already-normalized dialect, or None to fall back.
+            file_path: Optional path to the source file.
+
+        Returns:
+            The parsed Query object.
+
+        Raises:
+            ParseError: If sqlglot fails to parse the statement.
+        """
+        try:
+            # Use provided dialect, then default, then auto-detect
+            effective_dialect = dialect or self.default_dialect or self.detect_dialect(stmt.raw)
+
+            # Parse the single statement (stripped for safety)
+            parsed = sqlglot.parse_one(
+                stmt.raw,
+                dialect=effective_dialect,
+                error_level=sqlglot.errors.ErrorLevel.WARN,
+            )
+
+            return Query(
+                raw=raw,
+                normalized=self.normalize(parsed, dialect=effective_dialect),
+                dialect=effective_dialect or "unknown",
+                location=Location(
+                    line=stmt.line,
+                    column=stmt.column,
+                    file=str(file_path) if file_path else None,
+                    query_index=index,
+                ),
+                start_offset=stmt.start_offset,
+                end_offset=stmt.end_offset,
+                ast=parsed,
+                tables=tuple(self._extract_tables_from_ast(parsed)),
+                columns=tuple(self._extract_columns_from_ast(parsed)),
+                query_type=self._get_query_type_from_ast(parsed),
+                is_ddl=self._is_ddl(parsed),
+            )
+        except SqlglotParseError as e:
+            raise ParseError(
+                f"Failed to parse SQL statement: {e}",
+                sql=stmt.raw,
+                details=str(e),
+            ) from e
 
     def parse_single(
         self, sql: str, *, dialect: str | None = None, file_path: str | Path | None = None
@@ -187,20 +316,25 @@ class UniversalParser(BaseParser):
         Raises:
             ParseError: If the input is empty or contains multiple statements.
         """
-        # Remove comments and trim whitespace
-        clean_sql = re.sub(r"--.*", "", sql)
-        clean_sql = re.sub(r"/\*.*?\*/", "", clean_sql, flags=re.DOTALL)
-        clean_sql = clean_sql.strip()
+        # Split once and check the statement count before parsing anything:
+        # the splitter already skips comments and whitespace, and a
+        # multi-statement input is rejected without paying for sqlglot.
+        statements = self._split_source(sql)
 
-        if not clean_sql:
+        if not statements:
             raise ParseError("No SQL statement found in the input.")
 
-        queries = self.parse(sql, dialect=dialect, file_path=file_path)
+        if len(statements) > 1:
+            raise ParseError(f"Expected single statement, but found {len(statements)}.")
 
-        if len(queries) > 1:
-            raise ParseError(f"Expected single statement, but found {len(queries)}.")
-
-        return queries[0]
+        stmt = statements[0]
+        return self._parse_statement(
+            stmt,
+            0,
+            raw=sql[stmt.start_offset : stmt.end_offset],
+            dialect=self._normalize_dialect(dialect),
+            file_path=file_path,
+        )
 
     def detect_dialect(self, sql: str) -> str | None:
         """
@@ -275,10 +409,11 @@ class UniversalParser(BaseParser):
             return str(parsed_ast)
 
     def _extract_tables_from_ast(self, ast: Any) -> list[str]:
-        """Extract table names from a parsed AST."""
+        """Extract unique table names from a parsed AST, in order of appearance."""
         if not ast:
             return []
-        return [table.name for table in ast.find_all(exp.Table)]
+        # dict.fromkeys keeps first-seen order with O(1) membership checks
+        return list(dict.fromkeys(table.name for table in ast.find_all(exp.Table)))
 
     def extract_tables(self, sql: str, *, dialect: str | None = None) -> list[str]:
         """Extract table names from a raw SQL string."""
@@ -289,10 +424,10 @@ class UniversalParser(BaseParser):
             return []
 
     def _extract_columns_from_ast(self, ast: Any) -> list[str]:
-        """Extract column names from a parsed AST."""
+        """Extract unique column names from a parsed AST, in order of appearance."""
         if not ast:
             return []
-        return [column.name for column in ast.find_all(exp.Column)]
+        return list(dict.fromkeys(column.name for column in ast.find_all(exp.Column)))
 
     def extract_columns(self, sql: str, *, dialect: str | None = None) -> list[str]:
         """Extract column names from a raw SQL string."""
@@ -304,32 +439,24 @@ class UniversalParser(BaseParser):
 
     def get_query_type(self, sql: str) -> str | None:
         """Get the type of query (SELECT, INSERT, etc.) from a raw SQL string."""
-        # Fast path for common keywords
-        clean_sql = sql.lstrip().upper()
-        for keyword in ["SELECT", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP", "WITH"]:
-            if clean_sql.startswith(keyword):
-                return "SELECT" if keyword == "WITH" else keyword
-        return None
+        # Only the leading keyword is read; the statement is never copied or upper-cased.
+        match = _FIRST_KEYWORD_RE.match(sql)
+        if not match:
+            return None
+        keyword = match.group(1).upper()
+        if keyword == "WITH":
+            return "SELECT"
+        return keyword if keyword in _RAW_QUERY_TYPES else None
 
     def _get_query_type_from_ast(self, ast: Any) -> str | None:
         """Determine query type from the AST node."""
-        type_mapping = {
-            exp.Select: "SELECT",
-            exp.Insert: "INSERT",
-            exp.Update: "UPDATE",
-            exp.Delete: "DELETE",
-            exp.Merge: "MERGE",
-            exp.Create: "CREATE",
-            exp.Alter: "ALTER",
-            exp.Drop: "DROP",
-        }
-
-        for ast_type, name in type_mapping.items():
-            if isinstance(ast, ast_type):
-                return name
+        query_type = _AST_QUERY_TYPES.get(type(ast))
+        if query_type is not None:
+            return query_type
 
         if isinstance(ast, exp.Command):
-            return str(ast.this).upper().split()[0]
+            # Only the leading keyword is needed; avoid upper-casing the whole command.
+            return str(ast.this).split(None, 1)[0].upper()
 
         return type(ast).__name__.upper()
 
@@ -9,16 +9,18 @@ Useful for CI/CD integration and machine consumption.
 from __future__ import annotations
 
 import csv
+import io
 import json
 import sys
-from html import escape
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
 from slowql.core.models import Severity
 from slowql.reporters.base import BaseReporter
 
 if TYPE_CHECKING:
-    from slowql.core.models import AnalysisResult
+    from collections.abc import Iterable, Iterator
+
+    from slowql.core.models import AnalysisResult, Issue
 
 
 class JSONReporter(BaseReporter):
@@ -32,115 +34,33 @@ class JSONReporter(BaseReporter):
         """
         data = result.to_dict()
 
+        if self.output_file:
+            # Serialize straight into the file; no intermediate string.
+            json.dump(
+                data,
+                self.output_file,
+                indent=2,
+                ensure_ascii=False,
+                default=str,  # Handle datetimes etc.
+            )
+            return
+
         json_output = json.dumps(
             data,
             indent=2,
             ensure_ascii=False,
-            default=str,  # Handle datetimes etc.
+            default=str,
         )
+        print(json_output)
 
-        if self.output_file:
-            self.output_file.write(json_output)
-        else:
-            print(json_output)
-
-
-def _normalize_fix_text(fix_obj: Any) -> str:
-    """
-    Normalize the `fix` field into a human-readable string.
-
-    Supports:
-      - None
-      - str
-      - structured Fix objects with .description / .replacement
-    """
-    if fix_obj is None:
-        return ""
-
-    if isinstance(fix_obj, str):
-        txt = fix_obj.strip()
-        return "" if txt.lower() == "none" else txt
-
-    desc = getattr(fix_obj, "description", None)
-    repl = getattr(fix_obj, "replacement", None)
-
-    parts: list[str] = []
-    if desc:
-        parts.append(str(desc).strip())
-    if repl:
-        parts.append(str(repl).strip())
-
-    txt = " ".join(parts).strip()
-    return "" if txt.lower() == "none" else txt
-
-
-class HTMLReporter(BaseReporter):
-    """
-    Renders analysis results as a standalone HTML report.
 
-    One row per Issue, with:
-      - Severity
-      - Rule ID
-      - Dimension
-      - Message
-      - Impact
-      - Fix (normalized text)
-      - Location (if available)
-    """
+# Same replacements as html.escape(quote=True), applied in one C-level pass.
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
 
-    def _calculate_health_score(self, result: AnalysisResult) -> int:
-        """Calculate 0-100 health score based on severity of all issues."""
-        weights: dict[Severity, int] = {
-            Severity.CRITICAL: 25,
-            Severity.HIGH: 15,
-            Severity.MEDIUM: 5,
-            Severity.LOW: 2,
-            Severity.INFO: 0,
-        }
-        penalty = sum(weights.get(issue.severity, 0) for issue in result.issues)
-        return max(0, 100 - min(penalty, 100))
-
-    def report(self, result: AnalysisResult) -> None:
-        rows: list[dict[str, str]] = []
-
-        for issue in result.issues:
-            sev = getattr(issue.severity, "name", str(issue.severity))
-
-            rows.append(
-                {
-                    "severity": sev,
-                    "rule_id": issue.rule_id or "",
-                    "dimension": getattr(issue.dimension, "name", "")
-                    if getattr(issue, "dimension", None)
-                    else "",
-                    "message": issue.message or "",
-                    "impact": issue.impact or "",
-                    "fix": _normalize_fix_text(getattr(issue, "fix", None)),
-                    "location": f"{getattr(issue, 'location', '') or ''}",
-                }
-            )
-
-        # Build HTML table body
-        html_rows: list[str] = []
-        for r in rows:
-            html_rows.append(
-                f"""
-        <tr>
-          <td class="sev sev-{escape(r["severity"].lower())}">{escape(r["severity"])}</td>
-          <td>{escape(r["rule_id"])}</td>
-          <td>{escape(r["dimension"])}</td>
-          <td>{escape(r["message"])}</td>
-          <td>{escape(r["impact"])}</td>
-          <td>{escape(r["fix"])}</td>
-          <td>{escape(r["location"])}</td>
-        </tr>"""
-            )
+# CSS class per severity name, so rows don't lower-case and escape it each time.
+_SEV_CSS: dict[str, str] = {sev.name: f"sev-{sev.name.lower()}" for sev in Severity}
 
-        # Safe meta values
-        total_issues = getattr(result.statistics, "total_issues", len(result.issues))
-        health_score = self._calculate_health_score(result)
-
-        html = f"""<!DOCTYPE html>
+_HTML_HEADER = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
@@ -226,16 +146,143 @@ class HTMLReporter(BaseReporter):
       </tr>
     </thead>
     <tbody>
-      {"".join(html_rows)}
+      """
+
+_HTML_ROW = """
+        <tr>
+          <td class="sev {0}">{1}</td>
+          <td>{2}</td>
+          <td>{3}</td>
+          <td>{4}</td>
+          <td>{5}</td>
+          <td>{6}</td>
+          <td>{7}</td>
+        </tr>"""
+
+_HTML_FOOTER = """
     </tbody>
   </table>
 </body>
 </html>
 """
+
+
+def _normalize_fix_text(fix_obj: Any) -> str:
+    """
+    Normalize the `fix` field into a human-readable string.
+
+    Supports:
+      - None
+      - str
+      - structured Fix objects with .description / .replacement
+    """
+    if fix_obj is None:
+        return ""
+
+    if isinstance(fix_obj, str):
+        txt = fix_obj.strip()
+        return "" if txt.lower() == "none" else txt
+
+    desc = getattr(fix_obj, "description", None)
+    repl = getattr(fix_obj, "replacement", None)
+
+    parts: list[str] = []
+    if desc:
+        parts.append(str(desc).strip())
+    if repl:
+        parts.append(str(repl).strip())
+
+    txt = " ".join(parts).strip()
+    return "" if txt.lower() == "none" else txt
+
+
+# severity, rule_id, dimension, message, impact, fix, location
+_IssueRow = tuple[str, str, str, str, str, str, str]
+
+
+def _issue_rows(issues: Iterable[Issue]) -> Iterator[_IssueRow]:
+    """
+    Yield one flat row of display strings per issue.
+
+    Shared by the HTML and CSV reporters so the per-issue extraction
+    happens in one place.
+    """
+    for issue in issues:
+        yield (
+            getattr(issue.severity, "name", str(issue.severity)),
+            issue.rule_id or "",
+            getattr(issue.dimension, "name", "") if getattr(issue, "dimension", None) else "",
+            issue.message or "",
+            issue.impact or "",
+            _normalize_fix_text(getattr(issue, "fix", None)),
+            f"{getattr(issue, 'location', '') or ''}",
+        )
+
+
+class HTMLReporter(BaseReporter):
+    """
+    Renders analysis results as a standalone HTML report.
+
+    One row per Issue, with:
+      - Severity
+      - Rule ID
+      - Dimension
+      - Message
+      - Impact
+      - Fix (normalized text)
+      - Location (if available)
+    """
+
+    def _calculate_health_score(self, result: AnalysisResult) -> int:
+        """Calculate 0-100 health score based on severity of all issues."""
+        weights: dict[Severity, int] = {
+            Severity.CRITICAL: 25,
+            Severity.HIGH: 15,
+            Severity.MEDIUM: 5,
+            Severity.LOW: 2,
+            Severity.INFO: 0,
+        }
+        penalty = sum(weights.get(issue.severity, 0) for issue in result.issues)
+        return max(0, 100 - min(penalty, 100))
+
+    def report(self, result: AnalysisResult) -> None:
+        # Rows are produced lazily while writing, so nothing is staged per issue
+        # and a failing write stops extraction of the remaining issues.
+        rows = _issue_rows(result.issues)
+
+        # Safe meta values
+        total_issues = getattr(result.statistics, "total_issues", len(result.issues))
+        health_score = self._calculate_health_score(result)
+
         if self.output_file:
-            self.output_file.write(html)
+            self._write_html(self.output_file, rows, total_issues, health_score)
         else:
-            print(html)
+            buffer = io.StringIO()
+            self._write_html(buffer, rows, total_issues, health_score)
+            print(buffer.getvalue())
+
+    def _write_html(
+        self, out: TextIO, rows: Iterable[_IssueRow], total_issues: int, health_score: int
+    ) -> None:
+        """Write the report to ``out`` row by row instead of one large string."""
+        out.write(_HTML_HEADER.format(total_issues=total_issues, health_score=health_score))
+        esc = _HTML_ESCAPE
+        row_html = _HTML_ROW.format
+        write = out.write
+        for sev, rule_id, dim, msg, impact, fix_txt, loc in rows:
+            write(
+                row_html(
+                    _SEV_CSS.get(sev) or f"sev-{sev.lower().translate(esc)}",
+                    sev.translate(esc),
+                    rule_id.translate(esc),
+                    dim.translate(esc),
+                    msg.translate(esc),
+                    impact.translate(esc),
+                    fix_txt.translate(esc),
+                    loc.translate(esc),
+                )
+            )
+        write(_HTML_FOOTER)
 
 
 class CSVReporter(BaseReporter):
@@ -262,13 +309,4 @@ class CSVReporter(BaseReporter):
             ]
         )
 
-        for issue in result.issues:
-            sev = getattr(issue.severity, "name", str(issue.severity))
-            rule_id = issue.rule_id or ""
-            dim = getattr(issue.dimension, "name", "") if getattr(issue, "dimension", None) else ""
-            msg = issue.message or ""
-            impact = issue.impact or ""
-            fix_txt = _normalize_fix_text(getattr(issue, "fix", None))
-            loc = f"{getattr(issue, 'location', '') or ''}"
-
-            writer.writerow([sev, rule_id, dim, msg, impact, fix_txt, loc])
+        writer.writerows(_issue_rows(result.issues))
@@ -8,6 +8,7 @@ for creating SQL detection rules.
 
 from __future__ import annotations
 
+import functools
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -34,6 +35,12 @@ if TYPE_CHECKING:
     from slowql.core.models import AnalysisResult, Query
 
 
+@functools.cache
+def _compile(pattern: str, flags: int) -> Pattern[str]:
+    """Compile a regex once per process, shared by every rule instance."""
+    return re.compile(pattern, flags)
+
+
 @dataclass(frozen=True)
 class RuleMetadata:
     """
@@ -162,10 +169,6 @@ class Rule(ABC):
     examples: ClassVar[tuple[str, ...]] = ()
     references: ClassVar[tuple[str, ...]] = ()
 
-    def __init__(self) -> None:
-        """Initialize the rule."""
-        self._compiled_patterns: dict[str, Pattern[str]] = {}
-
     @abstractmethod
     def check(self, query: Query) -> list[Issue]:
         """
@@ -272,10 +275,7 @@ class Rule(ABC):
         Returns:
             Compiled pattern.
         """
-        cache_key = f"{pattern}:{flags}"
-        if cache_key not in self._compiled_patterns:
-            self._compiled_patterns[cache_key] = re.compile(pattern, flags)
-        return self._compiled_patterns[cache_key]
+        return _compile(pattern, flags)
 
     def _find_pattern(
         self,
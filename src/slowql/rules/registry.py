@@ -5,6 +5,8 @@ Rule registry for SlowQL.
 
 from __future__ import annotations
 
+import bisect
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 from slowql.core.models import Category, Dimension, Severity
@@ -21,9 +23,18 @@ if TYPE_CHECKING:
 class RuleRegistry:
     def __init__(self) -> None:
         self._rules: dict[str, Rule] = {}
-        self._by_dimension: dict[Dimension, list[str]] = {d: [] for d in Dimension}
-        self._by_category: dict[Category, list[str]] = {c: [] for c in Category}
-        self._by_severity: dict[Severity, list[str]] = {s: [] for s in Severity}
+        self._by_dimension: defaultdict[Dimension, list[str]] = defaultdict(list)
+        self._by_category: defaultdict[Category, list[str]] = defaultdict(list)
+        self._by_severity: defaultdict[Severity, list[str]] = defaultdict(list)
+        # Index keys each rule was filed under, so removal doesn't depend on
+        # the rule's (mutable) attributes or scan the index lists.
+        self._rule_positions: dict[str, tuple[Dimension, Category | None, Severity]] = {}
+        # Case-folded lookup text computed once per rule for search()/get_by_prefix().
+        self._searchable: dict[str, str] = {}
+        self._id_upper: dict[str, str] = {}
+        # Index lists are kept sorted on insert; get_all() is memoized until
+        # the next mutation. Lookups are far more frequent than registration.
+        self._sorted_all: list[Rule] | None = None
 
     def register(self, rule: Rule, *, replace: bool = False) -> None:
         rule_id = rule.id
@@ -34,28 +45,40 @@ class RuleRegistry:
         if rule_id in self._rules:
             self._remove_from_indices(rule_id)
         self._rules[rule_id] = rule
-        self._by_dimension[rule.dimension].append(rule_id)
+        self._sorted_all = None
+        bisect.insort(self._by_dimension[rule.dimension], rule_id)
         if rule.category:
-            self._by_category[rule.category].append(rule_id)
-        self._by_severity[rule.severity].append(rule_id)
+            bisect.insort(self._by_category[rule.category], rule_id)
+        bisect.insort(self._by_severity[rule.severity], rule_id)
+        self._rule_positions[rule_id] = (rule.dimension, rule.category, rule.severity)
+        self._searchable[rule_id] = f"{rule.id} {rule.name} {rule.description}".lower()
+        self._id_upper[rule_id] = rule_id.upper()
 
     def _remove_from_indices(self, rule_id: str) -> None:
-        rule = self._rules.get(rule_id)
-        if not rule:
+        position = self._rule_positions.pop(rule_id, None)
+        if position is None:
             return
-        if rule_id in self._by_dimension[rule.dimension]:
-            self._by_dimension[rule.dimension].remove(rule_id)
-        if rule.category and rule_id in self._by_category[rule.category]:
-            self._by_category[rule.category].remove(rule_id)
-        if rule_id in self._by_severity[rule.severity]:
-            self._by_severity[rule.severity].remove(rule_id)
+        dimension, category, severity = position
+        _discard_sorted(self._by_dimension[dimension], rule_id)
+        if category:
+            _discard_sorted(self._by_category[category], rule_id)
+        _discard_sorted(self._by_severity[severity], rule_id)
+        self._searchable.pop(rule_id, None)
+        self._id_upper.pop(rule_id, None)
 
     def unregister(self, rule_id: str) -> Rule | None:
         if rule_id not in self._rules:
             return None
         self._remove_from_indices(rule_id)
+        self._sorted_all = None
         return self._rules.pop(rule_id)
 
+    def set_enabled(self, rule_id: str, enabled: bool) -> None:
+        rule = self._rules.get(rule_id)
+        if rule is None:
+            raise ValueError(f"Rule '{rule_id}' is not registered.")
+        rule.enabled = enabled  # type: ignore[misc]  # per-instance override of the class default
+
     def get(self, rule_id: str) -> Rule | None:
         return self._rules.get(rule_id)
 
@@ -65,28 +88,36 @@ class RuleRegistry:
             return None
         return rule.metadata.to_dict()
 
+    def _all_sorted(self) -> list[Rule]:
+        if self._sorted_all is None:
+            self._sorted_all = [self._rules[k] for k in sorted(self._rules.keys())]
+        return self._sorted_all
+
     def get_all(self) -> list[Rule]:
-        return [self._rules[k] for k in sorted(self._rules.keys())]
+        return list(self._all_sorted())
 
     def get_by_dimension(self, dimension: Dimension) -> list[Rule]:
-        rule_ids = sorted(self._by_dimension.get(dimension, []))
-        return [self._rules[rid] for rid in rule_ids]
+        return [self._rules[rid] for rid in self._by_dimension.get(dimension, [])]
 
     def get_by_category(self, category: Category) -> list[Rule]:
-        rule_ids = sorted(self._by_category.get(category, []))
-        return [self._rules[rid] for rid in rule_ids]
+        return [self._rules[rid] for rid in self._by_category.get(category, [])]
 
     def get_by_severity(self, severity: Severity) -> list[Rule]:
-        rule_ids = sorted(self._by_severity.get(severity, []))
-        return [self._rules[rid] for rid in rule_ids]
+        return [self._rules[rid] for rid in self._by_severity.get(severity, [])]
 
     def get_by_prefix(self, prefix: str) -> list[Rule]:
         prefix_upper = prefix.upper()
-        matching = [rule_id for rule_id in self._rules if rule_id.upper().startswith(prefix_upper)]
+        matching = [
+            rule_id
+            for rule_id, rule_id_upper in self._id_upper.items()
+            if rule_id_upper.startswith(prefix_upper)
+        ]
         return [self._rules[rid] for rid in sorted(matching)]
 
     def get_enabled(self) -> list[Rule]:
-        return [rule for rule in self.get_all() if rule.enabled]
+        # Read the live flag, so rules toggled directly via rule.enabled agree
+        # with search(enabled_only=True) and stats().
+        return [rule for rule in self._all_sorted() if rule.enabled]
 
     def list_all(self) -> list[dict[str, Any]]:
         return [rule.metadata.to_dict() for rule in self.get_all()]
@@ -101,17 +132,15 @@ class RuleRegistry:
     ) -> list[Rule]:
         query_lower = query.lower()
         results = []
-        for rule in self._rules.values():
+        for rule_id, rule in self._rules.items():
             if enabled_only and not rule.enabled:
                 continue
             if dimensions and rule.dimension not in dimensions:
                 continue
             if severities and rule.severity not in severities:
                 continue
-            if query_lower:
-                searchable = f"{rule.id} {rule.name} {rule.description}".lower()
-                if query_lower not in searchable:
-                    continue
+            if query_lower and query_lower not in self._searchable[rule_id]:
+                continue
             results.append(rule)
         return sorted(results, key=lambda r: r.id)
 
@@ -120,9 +149,15 @@ class RuleRegistry:
             "total": len(self._rules),
             "enabled": sum(1 for r in self._rules.values() if r.enabled),
             "disabled": sum(1 for r in self._rules.values() if not r.enabled),
-            "by_dimension": {d.value: len(ids) for d, ids in self._by_dimension.items() if ids},
-            "by_severity": {s.value: len(ids) for s, ids in self._by_severity.items() if ids},
-            "by_category": {c.value: len(ids) for c, ids in self._by_category.items() if ids},
+            "by_dimension": {
+                d.value: len(self._by_dimension[d]) for d in Dimension if self._by_dimension.get(d)
+            },
+            "by_severity": {
+                s.value: len(self._by_severity[s]) for s in Severity if self._by_severity.get(s)
+            },
+            "by_category": {
+                c.value: len(self._by_category[c]) for c in Category if self._by_category.get(c)
+            },
         }
 
     def __len__(self) -> int:
@@ -136,9 +171,20 @@ class RuleRegistry:
 
     def clear(self) -> None:
         self._rules.clear()
-        self._by_dimension = {d: [] for d in Dimension}
-        self._by_category = {c: [] for c in Category}
-        self._by_severity = {s: [] for s in Severity}
+        self._sorted_all = None
+        self._by_dimension.clear()
+        self._by_category.clear()
+        self._by_severity.clear()
+        self._rule_positions.clear()
+        self._searchable.clear()
+        self._id_upper.clear()
+
+
+def _discard_sorted(ids: list[str], rule_id: str) -> None:
+    """Remove ``rule_id`` from the sorted list ``ids`` if present."""
+    i = bisect.bisect_left(ids, rule_id)
+    if i < len(ids) and ids[i] == rule_id:
+        del ids[i]
 
 
 _global_rule_registry: list[RuleRegistry] = []
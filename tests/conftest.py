@@ -1,5 +1,6 @@
 # tests/conftest.py
 import importlib.util
+import time
 from pathlib import Path
 
 import pytest
@@ -12,6 +13,15 @@ from slowql.core.models import Dimension, Issue, Location, Severity
 # -------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make time.sleep a no-op so CLI animations never wait on the wall clock.
+
+    Tests that assert on sleep calls can still patch it with their own mock.
+    """
+    monkeypatch.setattr(time, "sleep", lambda *_args, **_kwargs: None)
+
+
 @pytest.fixture(scope="session")
 def analyzer() -> SlowQL:
     """Shared SlowQL instance for all tests."""
@@ -37,27 +47,35 @@ def sample_queries() -> dict:
 # -------------------------------
 
 
-@pytest.fixture
-def sample_sql_file(tmp_path: Path) -> Path:
-    """Create a temporary SQL file with a few queries."""
+@pytest.fixture(scope="session")
+def sample_sql_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary SQL file with a few queries (read-only, shared per session)."""
     sql_content = """
     SELECT * FROM users;
     DELETE FROM orders;
     SELECT id, name FROM users WHERE id = 1;
     """
-    file_path = tmp_path / "sample.sql"
+    file_path = tmp_path_factory.mktemp("data") / "sample.sql"
     file_path.write_text(sql_content.strip(), encoding="utf-8")
     return file_path
 
 
-@pytest.fixture
-def empty_sql_file(tmp_path: Path) -> Path:
-    """Create an empty SQL file for error handling tests."""
-    file_path = tmp_path / "empty.sql"
+@pytest.fixture(scope="session")
+def empty_sql_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create an empty SQL file for error handling tests (read-only, shared per session)."""
+    file_path = tmp_path_factory.mktemp("data") / "empty.sql"
     file_path.write_text("", encoding="utf-8")
     return file_path
 
 
+@pytest.fixture
+def reports_dir(tmp_path: Path) -> Path:
+    """Per-test output directory for exported reports."""
+    path = tmp_path / "reports"
+    path.mkdir()
+    return path
+
+
 # -------------------------------
 # Helper Fixtures
 # -------------------------------
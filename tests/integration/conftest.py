@@ -0,0 +1,16 @@
+# tests/integration/conftest.py
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prime_slowql() -> None:
+    """Import the CLI and discover analyzers once for the whole session.
+
+    AnalyzerRegistry.discover() returns early once it has run, so every
+    in-process main() call after this reuses the populated global registry
+    instead of rescanning entry points.
+    """
+    import slowql.cli  # noqa: F401
+    from slowql.analyzers.registry import get_registry
+
+    get_registry().discover()
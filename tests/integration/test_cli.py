@@ -1,6 +1,9 @@
 # tests/integration/test_cli.py
-import subprocess
+import runpy
 import sys
+import warnings
+
+import pytest
 
 from slowql import cli
 
@@ -48,25 +51,27 @@ def test_cli_empty_file(empty_sql_file, capsys, monkeypatch):
 # -------------------------------
 # Export Formats
 # -------------------------------
-def test_cli_export_formats(sample_sql_file, tmp_path, capsys, monkeypatch):
+def test_cli_export_formats(sample_sql_file, reports_dir, capsys, monkeypatch):
+    """One analysis run exports every format (--export takes several values)."""
+    _, code = run_cli(
+        [
+            "--fast",
+            "--no-intro",
+            "--input-file",
+            str(sample_sql_file),
+            "--export",
+            "json",
+            "csv",
+            "html",
+            "--out",
+            str(reports_dir),
+        ],
+        capsys,
+        monkeypatch,
+    )
+    assert code == 0
     for fmt in ["json", "csv", "html"]:
-        out_dir = tmp_path / f"reports_{fmt}"
-        _, code = run_cli(
-            [
-                "--fast",
-                "--no-intro",
-                "--input-file",
-                str(sample_sql_file),
-                "--export",
-                fmt,
-                "--out",
-                str(out_dir),
-            ],
-            capsys,
-            monkeypatch,
-        )
-        assert code == 0
-        assert list(out_dir.glob(f"*.{fmt}"))
+        assert list(reports_dir.glob(f"*.{fmt}"))
 
 
 def test_cli_invalid_export_format(sample_sql_file, tmp_path, capsys, monkeypatch):
@@ -211,31 +216,27 @@ def test_cli_nonfast_path(monkeypatch, sample_sql_file, capsys):
 # -------------------------------
 # __main__ entrypoint
 # -------------------------------
-def test_cli_main_entrypoint(sample_sql_file):
-    import os
-    from pathlib import Path
-
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(Path("src").resolve())
-
-    result = subprocess.run(
+def test_cli_main_entrypoint(sample_sql_file, capsys, monkeypatch):
+    """Run slowql.cli.app as __main__ in-process instead of spawning an interpreter."""
+    monkeypatch.setattr(
+        sys,
+        "argv",
         [
-            sys.executable,
-            "-m",
-            "slowql.cli.app",
+            "slowql",
             "--no-intro",
             "--fast",
             "--non-interactive",
             "--input-file",
             str(sample_sql_file),
         ],
-        env=env,
-        check=False,
-        capture_output=True,
-        text=True,
     )
-    assert result.returncode == 0
-    assert "SlowQL" in result.stdout
+    with warnings.catch_warnings():
+        # runpy warns because slowql.cli.app is already imported via slowql.cli
+        warnings.simplefilter("ignore", RuntimeWarning)
+        with pytest.raises(SystemExit) as exc:
+            runpy.run_module("slowql.cli.app", run_name="__main__")
+    assert exc.value.code == 0
+    assert "SlowQL" in capsys.readouterr().out
 
 
 # -------------------------------
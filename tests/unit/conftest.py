@@ -0,0 +1,21 @@
+# tests/unit/conftest.py
+import sys
+from unittest.mock import MagicMock
+
+
+def pytest_configure() -> None:
+    """Stand in for readchar when the optional ``interactive`` extra isn't installed.
+
+    The stub mirrors the parts of the readchar API the CLI uses, so the app
+    and its tests import the same way with or without the real package.
+    """
+    try:
+        import readchar  # noqa: F401
+    except ImportError:
+        stub = MagicMock()
+        stub.key.UP = "UP_KEY"
+        stub.key.DOWN = "DOWN_KEY"
+        stub.key.ENTER = "ENTER_KEY"
+        stub.key.CTRL_C = "CTRL_C_KEY"
+        sys.modules["readchar"] = stub
+        sys.modules["readchar.key"] = stub.key
@@ -1,23 +1,33 @@
+from dataclasses import dataclass
 from typing import Any, ClassVar
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from slowql.analyzers.registry import AnalyzerRegistry, analyzer, get_registry
 from slowql.core.models import Dimension
 
 
+@dataclass(slots=True, frozen=True)
 class MockEp:
-    def __init__(self, name: str, load_return: Any, raise_error: Exception | None = None) -> None:
-        self.name = name
-        self._load_return = load_return
-        self._raise_error = raise_error
+    name: str
+    load_return: Any = None
+    raise_error: Exception | None = None
 
     def load(self) -> Any:
-        if self._raise_error:
-            raise self._raise_error
-        return self._load_return
+        if self.raise_error:
+            raise self.raise_error
+        return self.load_return
+
+
+@pytest.fixture
+def empty_builtins(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip loading the built-in analyzers so discovery tests only exercise entry points."""
+    monkeypatch.setattr(AnalyzerRegistry, "_load_builtin_analyzers", lambda _self: 0)
 
 
 class TestAnalyzerRegistryCoverage:
+    @pytest.mark.usefixtures("empty_builtins")
     def test_discover_py39(self) -> None:
         # Mock sys.version_info to be 3.9
         with (
@@ -36,10 +46,10 @@ class TestAnalyzerRegistryCoverage:
 
             registry = AnalyzerRegistry()
             count = registry.discover()
-            # Should find 1 mock analyzer + builtins (if they load).
-            # To isolate, we could mock _load_builtin_analyzers to return 0.
+            # Builtins are skipped; installed entry points may still add analyzers
             assert count >= 1
 
+    @pytest.mark.usefixtures("empty_builtins")
     def test_discover_exceptions_and_types(self) -> None:
         registry = AnalyzerRegistry()
 
@@ -70,7 +80,6 @@ class TestAnalyzerRegistryCoverage:
             patch("sys.version_info", (3, 10)),
             patch("importlib.metadata.entry_points", return_value=eps),
             patch("sys.stderr.write"),  # Suppress error prints
-            patch.object(registry, "_load_builtin_analyzers", return_value=0),
         ):
             registry.discover()
 
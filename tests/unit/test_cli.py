@@ -3,15 +3,23 @@
 Test CLI functionality.
 """
 
-from slowql.cli import app
+import importlib
 
+import pytest
 
-def test_cli_app_import():
+
+@pytest.fixture(scope="module")
+def app():
+    """Import the CLI app lazily, so collecting this module doesn't load Rich and the CLI."""
+    return importlib.import_module("slowql.cli.app")
+
+
+def test_cli_app_import(app):
     """Test that CLI app can be imported."""
     assert app is not None
 
 
-def test_cli_main_function():
+def test_cli_main_function(app):
     """Test that main function exists."""
     assert hasattr(app, "main")
     assert callable(app.main)
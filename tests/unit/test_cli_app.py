@@ -1,11 +1,14 @@
 """Tests for CLI app functionality."""
 
 import json
+import sys
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
+import pytest
+
 from slowql.cli.app import (
     QueryCache,
     SessionManager,
@@ -23,6 +26,12 @@ from slowql.cli.app import (
 from slowql.core.models import AnalysisResult, Dimension, Issue, Location, Query, Severity
 
 
+@pytest.fixture
+def no_readchar(monkeypatch):
+    """Make ``import readchar`` fail so the menus fall back to numeric prompts."""
+    monkeypatch.setitem(sys.modules, "readchar", None)
+
+
 class TestSessionManager:
     """Test SessionManager class."""
 
@@ -215,10 +224,9 @@ class TestExportFunctions:
             # Should print 3 success messages
             assert mock_console.print.call_count == 3
 
-    @patch("slowql.cli.app.console")
     @patch("slowql.cli.app.ensure_reports_dir")
     @patch("slowql.cli.app.safe_path")
-    def test_run_exports_with_error(self, mock_safe_path, mock_ensure_reports_dir, mock_console):
+    def test_run_exports_with_error(self, mock_safe_path, mock_ensure_reports_dir, capsys):
         """Test _run_exports with export error."""
         mock_safe_path.return_value = Path("/tmp/reports")
         mock_ensure_reports_dir.return_value = Path("/tmp/reports")
@@ -229,10 +237,10 @@ class TestExportFunctions:
             _run_exports(result, ["json"], Path("/tmp/reports"))
 
             # Should print error message
-            mock_console.print.assert_called_once()
-            args = mock_console.print.call_args[0][0]
-            assert "Failed to export json" in args
+            out = capsys.readouterr().out
+            assert out.count("Failed to export json") == 1
 
+    @pytest.mark.usefixtures("no_readchar")
     @patch("slowql.cli.app.export_interactive")
     @patch("slowql.cli.app.console")
     @patch("slowql.cli.app.Prompt")
@@ -244,13 +252,12 @@ class TestExportFunctions:
         result = MagicMock()
         out_dir = Path("/tmp")
 
-        # Test export selection with fallback by mocking readchar import to fail
-        with patch.dict("sys.modules", {"readchar": None}):
-            continue_analysis = show_quick_actions_menu(result, None, out_dir)
+        continue_analysis = show_quick_actions_menu(result, None, out_dir)
 
-            mock_export.assert_called_once_with(result, out_dir)
-            assert continue_analysis is True
+        mock_export.assert_called_once_with(result, out_dir)
+        assert continue_analysis is True
 
+    @pytest.mark.usefixtures("no_readchar")
     @patch("slowql.cli.app.export_interactive")
     @patch("slowql.cli.app.console")
     @patch("slowql.cli.app.Prompt")
@@ -264,13 +271,12 @@ class TestExportFunctions:
         result = MagicMock()
         out_dir = Path("/tmp")
 
-        # Test with readchar import failure
-        with patch.dict("sys.modules", {"readchar": None}):
-            continue_analysis = show_quick_actions_menu(result, None, out_dir)
+        continue_analysis = show_quick_actions_menu(result, None, out_dir)
 
-            assert continue_analysis is True
-            mock_export.assert_not_called()
+        assert continue_analysis is True
+        mock_export.assert_not_called()
 
+    @pytest.mark.usefixtures("no_readchar")
     @patch("slowql.cli.app.console")
     @patch("slowql.cli.app.Prompt")
     def test_show_quick_actions_menu_continue_fallback(self, mock_prompt, _mock_console):
@@ -281,11 +287,11 @@ class TestExportFunctions:
         result = MagicMock()
         out_dir = Path("/tmp")
 
-        with patch.dict("sys.modules", {"readchar": None}):
-            continue_analysis = show_quick_actions_menu(result, None, out_dir)
+        continue_analysis = show_quick_actions_menu(result, None, out_dir)
 
-            assert continue_analysis is True
+        assert continue_analysis is True
 
+    @pytest.mark.usefixtures("no_readchar")
     @patch("slowql.cli.app.console")
     @patch("slowql.cli.app.Prompt")
     def test_show_quick_actions_menu_exit_fallback(self, mock_prompt, _mock_console):
@@ -296,11 +302,11 @@ class TestExportFunctions:
         result = MagicMock()
         out_dir = Path("/tmp")
 
-        with patch.dict("sys.modules", {"readchar": None}):
-            continue_analysis = show_quick_actions_menu(result, None, out_dir)
+        continue_analysis = show_quick_actions_menu(result, None, out_dir)
 
-            assert continue_analysis is False
+        assert continue_analysis is False
 
+    @pytest.mark.usefixtures("no_readchar")
     @patch("slowql.cli.app._run_exports")
     @patch("slowql.cli.app.console")
     @patch("slowql.cli.app.Prompt")
@@ -311,11 +317,11 @@ class TestExportFunctions:
         result = MagicMock()
         out_dir = Path("/tmp")
 
-        with patch.dict("sys.modules", {"readchar": None}):
-            export_interactive(result, out_dir)
+        export_interactive(result, out_dir)
 
-            mock_run_exports.assert_called_once_with(result, ["json"], out_dir)
+        mock_run_exports.assert_called_once_with(result, ["json"], out_dir)
 
+    @pytest.mark.usefixtures("no_readchar")
     @patch("slowql.cli.app._run_exports")
     @patch("slowql.cli.app.console")
     @patch("slowql.cli.app.Prompt")
@@ -326,10 +332,9 @@ class TestExportFunctions:
         result = MagicMock()
         out_dir = Path("/tmp")
 
-        with patch.dict("sys.modules", {"readchar": None}):
-            export_interactive(result, out_dir)
+        export_interactive(result, out_dir)
 
-            mock_run_exports.assert_called_once_with(result, ["json", "html", "csv", "sarif"], out_dir)
+        mock_run_exports.assert_called_once_with(result, ["json", "html", "csv", "sarif"], out_dir)
 
 
 class TestCompareMode:
@@ -862,12 +867,17 @@ class TestRunAnalysisLoop:
         # and the export should be called
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Build the real argument parser once for every test in this module."""
+    return build_argparser()
+
+
 class TestArgumentParser:
     """Test argument parser functionality."""
 
-    def test_build_argparser(self):
+    def test_build_argparser(self, parser):
         """Test argument parser creation."""
-        parser = build_argparser()
         assert parser is not None
 
         # Test parsing basic args
@@ -900,40 +910,12 @@ class TestMainFunction:
     @patch("slowql.cli.app.init_cli")
     @patch("slowql.cli.app.build_argparser")
     @patch("slowql.cli.app.run_analysis_loop")
-    def test_main_default_non_interactive(self, mock_run_loop, mock_build_parser, mock_init_cli, mock_sys):
+    def test_main_default_non_interactive(self, mock_run_loop, mock_build_parser, mock_init_cli, mock_sys, parser):
         """Test main defaults to non-interactive when --interactive is not passed."""
         mock_sys.stdin.isatty.return_value = True
         mock_sys.stdout.isatty.return_value = True
         mock_sys.argv = ["slowql"]
-
-        mock_parser = MagicMock()
-        mock_args = MagicMock()
-        mock_args.file = None
-        mock_args.input_file = None
-        mock_args.no_intro = False
-        mock_args.duration = 3.0
-        mock_args.mode = "auto"
-        mock_args.export = None
-        mock_args.out = Path("reports")
-        mock_args.fast = False
-        mock_args.verbose = False
-        mock_args.interactive = False
-        mock_args.non_interactive = False
-        mock_args.no_cache = False
-        mock_args.cache_dir = ".slowql_cache"
-        mock_args.clear_cache = False
-        mock_args.compare = False
-        mock_args.schema = None
-        mock_args.dialect = None
-        mock_args.extra_files = []
-        mock_args.list_rules = False
-        mock_args.init = False
-        mock_args.explain = None
-        mock_args.filter_dimension = None
-        mock_args.filter_dialect = None
-
-        mock_parser.parse_args.return_value = mock_args
-        mock_build_parser.return_value = mock_parser
+        mock_build_parser.return_value = parser
 
         main()
 
@@ -946,7 +928,7 @@ class TestMainFunction:
             mode="auto",
             initial_input_file=None,
             export_formats=None,
-            out_dir=Path("reports"),
+            out_dir=Path.cwd() / "reports",
             fast=False,
             verbose=False,
             non_interactive=True,
@@ -954,46 +936,19 @@ class TestMainFunction:
             cache_dir=".slowql_cache",
             clear_cache=False,
             enable_comparison=False,
+            jobs=0,
         )
 
     @patch("slowql.cli.app.sys")
     @patch("slowql.cli.app.init_cli")
     @patch("slowql.cli.app.build_argparser")
     @patch("slowql.cli.app.run_analysis_loop")
-    def test_main_interactive_flag_on_tty(self, mock_run_loop, mock_build_parser, mock_init_cli, mock_sys):
+    def test_main_interactive_flag_on_tty(self, mock_run_loop, mock_build_parser, mock_init_cli, mock_sys, parser):
         """Test main enables interactive mode when --interactive is passed on a TTY."""
         mock_sys.stdin.isatty.return_value = True
         mock_sys.stdout.isatty.return_value = True
-        mock_sys.argv = ["slowql"]
-
-        mock_parser = MagicMock()
-        mock_args = MagicMock()
-        mock_args.file = None
-        mock_args.input_file = None
-        mock_args.no_intro = False
-        mock_args.duration = 3.0
-        mock_args.mode = "auto"
-        mock_args.export = None
-        mock_args.out = Path("reports")
-        mock_args.fast = False
-        mock_args.verbose = False
-        mock_args.interactive = True
-        mock_args.non_interactive = False
-        mock_args.no_cache = False
-        mock_args.cache_dir = ".slowql_cache"
-        mock_args.clear_cache = False
-        mock_args.compare = False
-        mock_args.schema = None
-        mock_args.dialect = None
-        mock_args.extra_files = []
-        mock_args.list_rules = False
-        mock_args.init = False
-        mock_args.explain = None
-        mock_args.filter_dimension = None
-        mock_args.filter_dialect = None
-
-        mock_parser.parse_args.return_value = mock_args
-        mock_build_parser.return_value = mock_parser
+        mock_sys.argv = ["slowql", "--interactive"]
+        mock_build_parser.return_value = parser
 
         main()
 
@@ -1005,40 +960,12 @@ class TestMainFunction:
     @patch("slowql.cli.app.init_cli")
     @patch("slowql.cli.app.build_argparser")
     @patch("slowql.cli.app.run_analysis_loop")
-    def test_main_interactive_flag_no_tty(self, mock_run_loop, mock_build_parser, mock_init_cli, mock_sys):
+    def test_main_interactive_flag_no_tty(self, mock_run_loop, mock_build_parser, mock_init_cli, mock_sys, parser):
         """Test --interactive is ignored when stdin is not a TTY."""
         mock_sys.stdin.isatty.return_value = False
         mock_sys.stdout.isatty.return_value = False
-        mock_sys.argv = ["slowql"]
-
-        mock_parser = MagicMock()
-        mock_args = MagicMock()
-        mock_args.file = None
-        mock_args.input_file = None
-        mock_args.no_intro = False
-        mock_args.duration = 3.0
-        mock_args.mode = "auto"
-        mock_args.export = None
-        mock_args.out = Path("reports")
-        mock_args.fast = False
-        mock_args.verbose = False
-        mock_args.interactive = True
-        mock_args.non_interactive = False
-        mock_args.no_cache = False
-        mock_args.cache_dir = ".slowql_cache"
-        mock_args.clear_cache = False
-        mock_args.compare = False
-        mock_args.schema = None
-        mock_args.dialect = None
-        mock_args.extra_files = []
-        mock_args.list_rules = False
-        mock_args.init = False
-        mock_args.explain = None
-        mock_args.filter_dimension = None
-        mock_args.filter_dialect = None
-
-        mock_parser.parse_args.return_value = mock_args
-        mock_build_parser.return_value = mock_parser
+        mock_sys.argv = ["slowql", "--interactive"]
+        mock_build_parser.return_value = parser
 
         main()
 
@@ -1050,40 +977,12 @@ class TestMainFunction:
     @patch("slowql.cli.app.init_cli")
     @patch("slowql.cli.app.build_argparser")
     @patch("slowql.cli.app.run_analysis_loop")
-    def test_main_non_interactive_overrides_interactive(self, mock_run_loop, mock_build_parser, mock_init_cli, mock_sys):
+    def test_main_non_interactive_overrides_interactive(self, mock_run_loop, mock_build_parser, mock_init_cli, mock_sys, parser):
         """Test --non-interactive overrides --interactive for backward compat."""
         mock_sys.stdin.isatty.return_value = True
         mock_sys.stdout.isatty.return_value = True
-        mock_sys.argv = ["slowql"]
-
-        mock_parser = MagicMock()
-        mock_args = MagicMock()
-        mock_args.file = None
-        mock_args.input_file = None
-        mock_args.no_intro = False
-        mock_args.duration = 3.0
-        mock_args.mode = "auto"
-        mock_args.export = None
-        mock_args.out = Path("reports")
-        mock_args.fast = False
-        mock_args.verbose = False
-        mock_args.interactive = True
-        mock_args.non_interactive = True
-        mock_args.no_cache = False
-        mock_args.cache_dir = ".slowql_cache"
-        mock_args.clear_cache = False
-        mock_args.compare = False
-        mock_args.schema = None
-        mock_args.dialect = None
-        mock_args.extra_files = []
-        mock_args.list_rules = False
-        mock_args.init = False
-        mock_args.explain = None
-        mock_args.filter_dimension = None
-        mock_args.filter_dialect = None
-
-        mock_parser.parse_args.return_value = mock_args
-        mock_build_parser.return_value = mock_parser
+        mock_sys.argv = ["slowql", "--interactive", "--non-interactive"]
+        mock_build_parser.return_value = parser
 
         main()
 
@@ -1,8 +1,23 @@
 
+import pytest
+
 from slowql.core.engine import SlowQL
 
 
-def test_unreachable_code_after_return():
+@pytest.fixture(scope="module")
+def _shared_engine():
+    return SlowQL()
+
+
+@pytest.fixture
+def engine(_shared_engine):
+    """One SlowQL per module; analyzers and parser are loaded once."""
+    yield _shared_engine
+    # analyze() keeps any schema it auto-detects from DDL; don't leak it into the next test
+    _shared_engine.schema = None
+
+
+def test_unreachable_code_after_return(engine):
     sql = """
     CREATE PROCEDURE TestProc()
     AS
@@ -12,7 +27,6 @@ def test_unreachable_code_after_return():
         SELECT 2;
     END;
     """
-    engine = SlowQL()
     result = engine.analyze(sql, dialect="tsql")
 
     # Verify that we found the unreachable code issue
@@ -21,7 +35,7 @@ def test_unreachable_code_after_return():
     assert "Unreachable code" in unreachable_issues[0].message
     assert "SELECT 2" in unreachable_issues[0].snippet
 
-def test_unused_object_detection():
+def test_unused_object_detection(engine):
     sql = """
     CREATE VIEW UnusedView AS SELECT 1;
     CREATE PROCEDURE UnusedProc AS BEGIN SELECT 2; END;
@@ -30,7 +44,6 @@ def test_unused_object_detection():
     CREATE VIEW UsedView AS SELECT 3;
     SELECT * FROM UsedView;
     """
-    engine = SlowQL()
     result = engine.analyze(sql, dialect="tsql")
 
     unused_issues = [i for i in result.issues if i.rule_id == "QUAL-DEAD-001"]
@@ -43,14 +56,13 @@ def test_unused_object_detection():
     assert any("UNUSEDFUNC" in m.upper() for m in messages)
     assert not any("'USEDVIEW'" in m.upper() for m in messages)
 
-def test_duplicate_query_detection():
+def test_duplicate_query_detection(engine):
     sql = """
     SELECT * FROM Users WHERE id = 1;
     SELECT * FROM Users WHERE id = 1; -- Exact duplicate
     SELECT * FROM Users WHERE id = 2;
     SELECT * FROM users WHERE ID = 1; -- Near duplicate (different case/whitespace)
     """
-    engine = SlowQL()
     result = engine.analyze(sql)
 
     dup_issues = [i for i in result.issues if i.rule_id == "QUAL-DEAD-003"]
@@ -59,56 +71,58 @@ def test_duplicate_query_detection():
     for issue in dup_issues:
         assert "Duplicate query detected" in issue.message
 
-def test_unused_view_detection():
+def test_unused_view_detection(engine):
     sql1 = "CREATE VIEW UnusedView AS SELECT 1;"
     sql2 = "SELECT 1;" # No reference to UnusedView
 
-    engine = SlowQL()
     result = engine.analyze(sql1 + "\n" + sql2)
 
     unused_issues = [i for i in result.issues if i.rule_id == "QUAL-DEAD-001"]
     assert len(unused_issues) == 1
     assert "UNUSEDVIEW" in unused_issues[0].message.upper()
 
-def test_used_view_detection():
+def test_used_view_detection(engine):
     sql1 = "CREATE VIEW UsedView AS SELECT 1;"
     sql2 = "SELECT * FROM UsedView;"
 
-    engine = SlowQL()
     result = engine.analyze(sql1 + "\n" + sql2)
 
     unused_issues = [i for i in result.items if i.rule_id == "QUAL-DEAD-001"] if hasattr(result, "items") else [i for i in result.issues if i.rule_id == "QUAL-DEAD-001"]
     assert len(unused_issues) == 0
 
-def test_unused_procedure_detection():
+def test_unused_procedure_detection(engine):
     sql1 = "CREATE PROCEDURE UnusedProc AS BEGIN SELECT 1; END;"
     sql2 = "SELECT 1;"
 
-    engine = SlowQL()
     result = engine.analyze(sql1 + "\n" + sql2, dialect="tsql")
 
     unused_issues = [i for i in result.issues if i.rule_id == "QUAL-DEAD-001"]
     assert len(unused_issues) == 1
     assert "UNUSEDPROC" in unused_issues[0].message.upper()
 
-def test_near_duplicate_query_detection():
+def test_near_duplicate_query_detection(engine):
     sql1 = "SELECT * FROM Users WHERE id = 1;"
     sql2 = "SELECT * FROM Users WHERE id = 2;" # Near duplicate (same normalized)
     sql3 = "SELECT name FROM Users;"
 
-    engine = SlowQL()
     result = engine.analyze(sql1 + "\n" + sql2 + "\n" + sql3)
 
     dup_issues = [i for i in result.issues if i.rule_id == "QUAL-DEAD-003"]
     assert len(dup_issues) >= 1
     assert "duplicate" in dup_issues[0].message.lower()
 
-def test_no_duplicate_queries():
+def test_no_duplicate_queries(engine):
     sql1 = "SELECT * FROM Users;"
     sql2 = "SELECT count(*) FROM Orders;"
 
-    engine = SlowQL()
     result = engine.analyze(sql1 + "\n" + sql2)
 
     dup_issues = [i for i in result.issues if i.rule_id == "QUAL-DEAD-003"]
     assert len(dup_issues) == 0
+
+def test_shared_engine_is_repeatable(engine):
+    sql = "CREATE VIEW UnusedView AS SELECT 1;\nSELECT * FROM Users;\nSELECT * FROM Users;"
+    first = sorted((i.rule_id, i.location.line) for i in engine.analyze(sql).issues)
+    engine.schema = None
+    second = sorted((i.rule_id, i.location.line) for i in engine.analyze(sql).issues)
+    assert first == second
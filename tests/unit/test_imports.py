@@ -3,10 +3,13 @@ Test that all modules can be imported and basic instantiation works.
 This helps increase coverage by executing import-time code.
 """
 
-from slowql import analyze, analyze_file, core
+import importlib
+
+import pytest
+
+from slowql import analyze, analyze_file
 from slowql.analyzers import base as analyzers_base
 from slowql.analyzers import registry as analyzers_registry
-from slowql.cli import app as cli_app
 from slowql.core.config import Config
 from slowql.core.engine import SlowQL
 from slowql.core.exceptions import ParseError, SlowQLError
@@ -21,34 +24,27 @@ from slowql.core.models import (
 from slowql.parser import base as parser_base
 from slowql.parser import tokenizer, universal
 from slowql.rules import base as rules_base
-from slowql.rules import catalog
-
-
-def test_import_core():
-    assert core.config
-    assert core.engine
-    assert core.exceptions
-    assert core.models
-
-
-def test_import_analyzers():
-    assert analyzers_base
-    assert analyzers_registry
 
 
-def test_import_parser():
-    assert parser_base
-    assert tokenizer
-    assert universal
-
-
-def test_import_rules():
-    assert rules_base
-    assert catalog
-
-
-def test_import_cli():
-    assert cli_app
+@pytest.mark.parametrize(
+    "module",
+    [
+        "slowql.core.config",
+        "slowql.core.engine",
+        "slowql.core.exceptions",
+        "slowql.core.models",
+        "slowql.analyzers.base",
+        "slowql.analyzers.registry",
+        "slowql.parser.base",
+        "slowql.parser.tokenizer",
+        "slowql.parser.universal",
+        "slowql.rules.base",
+        "slowql.rules.catalog",
+        "slowql.cli.app",
+    ],
+)
+def test_import(module):
+    assert importlib.import_module(module)
 
 
 def test_instantiate_core_classes():
@@ -4,9 +4,8 @@ import importlib
 def reload_slowql(monkeypatch, fake_version_func):
     # Patch importlib.metadata.version
     monkeypatch.setattr("importlib.metadata.version", fake_version_func)
-    # Reload module to re-execute __init__.py
-    if "slowql" in importlib.sys.modules:
-        del importlib.sys.modules["slowql"]
+    # Reload module to re-execute __init__.py; the original is restored on teardown
+    monkeypatch.delitem(importlib.sys.modules, "slowql", raising=False)
     import slowql
 
     return slowql
@@ -43,8 +42,7 @@ def test_version_none(monkeypatch):
 def test_importlib_metadata_missing(monkeypatch):
     # Simulate importlib.metadata not available
     monkeypatch.setitem(importlib.sys.modules, "importlib.metadata", None)
-    if "slowql" in importlib.sys.modules:
-        del importlib.sys.modules["slowql"]
+    monkeypatch.delitem(importlib.sys.modules, "slowql", raising=False)
     import slowql
 
     assert slowql.__version__ is None
@@ -57,12 +57,19 @@ def test_universal_parser_extractors():
     assert "name" in cols
     assert "status" in cols
 
+    # Duplicates are dropped, first-seen order is kept
+    assert parser.extract_tables("SELECT * FROM b JOIN a ON b.x = a.x JOIN b AS b2 ON 1 = 1") == ["b", "a"]
+    assert parser.extract_columns("SELECT id, name, id FROM users WHERE name = 'x'") == ["id", "name"]
+
 def test_universal_parser_get_query_type():
     parser = UniversalParser()
     assert parser.get_query_type("   select * from t") == "SELECT"
     assert parser.get_query_type("WITH cte AS (...) SELECT * FROM cte") == "SELECT"
     assert parser.get_query_type("INSERT INTO t VALUES (1)") == "INSERT"
     assert parser.get_query_type("SOME_UNKNOWN_CMD") is None
+    assert parser.get_query_type("-- note\n/* block */ delete from t") == "DELETE"
+    assert parser.get_query_type("/* unterminated") is None
+    assert parser.get_query_type("") is None
 
 def test_universal_parser_normalize_fallback():
     parser = UniversalParser()
@@ -90,3 +97,44 @@ def test_universal_parser_parse_error():
     from unittest.mock import patch
     with patch("slowql.parser.source_splitter.SourceSplitter.split", side_effect=Exception("Split failed")), pytest.raises(ParseError):
         parser.parse("SELECT 1")
+
+def test_universal_parser_parse_single_rejects_before_parsing():
+    parser = UniversalParser()
+    from unittest.mock import patch
+    with patch("slowql.parser.universal.sqlglot.parse_one") as mock_parse_one:
+        with pytest.raises(ParseError):
+            parser.parse_single("SELECT 1; SELECT 2;")
+        with pytest.raises(ParseError):
+            parser.parse_single("/* only a comment */")
+    mock_parse_one.assert_not_called()
+
+def test_universal_parser_parse_parallel_matches_serial():
+    parser = UniversalParser()
+    sql = "\n".join(f"SELECT c{i} FROM t{i};" for i in range(parser.PARALLEL_PARSE_THRESHOLD))
+    serial = parser.parse(sql)
+    parallel = parser.parse(sql, workers=2)
+    assert [q.raw for q in parallel] == [q.raw for q in serial]
+    assert [q.location for q in parallel] == [q.location for q in serial]
+    assert [q.tables for q in parallel] == [q.tables for q in serial]
+
+def test_universal_parser_parse_below_threshold_is_serial():
+    parser = UniversalParser()
+    from unittest.mock import patch
+    with patch("slowql.parser.universal.concurrent.futures.ProcessPoolExecutor") as mock_pool:
+        queries = parser.parse("SELECT 1; SELECT 2;", workers=4)
+    assert len(queries) == 2
+    mock_pool.assert_not_called()
+
+def test_universal_parser_query_type_dispatch():
+    parser = UniversalParser()
+    assert parser.parse_single("TRUNCATE TABLE users").query_type == "TRUNCATE"
+    assert parser.parse_single("MERGE INTO t USING s ON t.id = s.id WHEN MATCHED THEN DELETE").query_type == "MERGE"
+    assert parser.parse_single("SELECT 1 UNION SELECT 2").query_type == "UNION"
+
+def test_universal_parser_dialect_aliases():
+    parser = UniversalParser(dialect="mssql")
+    assert parser.default_dialect == "tsql"
+    assert parser._normalize_dialect(None) is None
+    assert parser._normalize_dialect("tsql") == "tsql"
+    assert parser._normalize_dialect("postgresql") == "postgres"
+    assert parser.parse("SELECT 1", dialect="postgresql")[0].dialect == "postgres"
@@ -8,26 +8,28 @@ from slowql.core.exceptions import ParseError
 from slowql.parser.universal import UniversalParser
 
 
+@pytest.fixture(scope="module")
+def parser():
+    return UniversalParser()
+
+
 class TestUniversalParserExtra:
-    def test_parse_exception(self):
+    def test_parse_exception(self, parser):
         # Generic exceptions from statement splitting should be wrapped in ParseError.
-        parser = UniversalParser()
         with (
             patch("slowql.parser.universal.SourceSplitter.split", side_effect=Exception("Boom")),
             pytest.raises(ParseError),
         ):
             parser.parse("SELECT 1")
 
-    def test_extract_tables_edge_cases(self):
+    def test_extract_tables_edge_cases(self, parser):
         # Indirectly cover extract_tables/columns lines if missed
-        parser = UniversalParser()
         # Test with complex query
         q = parser.parse_single("SELECT * FROM t1 JOIN t2 ON t1.id = t2.id")
         assert len(q.tables) == 2
 
-    def test_normalize_empty_ast(self):
+    def test_normalize_empty_ast(self, parser):
         # Lines 232, 234
-        parser = UniversalParser()
         # Mock AST that returns None for sql()
         ast = MagicMock()
         ast.sql.return_value = ""
@@ -38,9 +40,8 @@ class TestUniversalParserExtra:
         # normalize(self, ast: Any, dialect: str | None = None) -> str
         pass
 
-    def test_parse_sqlglot_error(self):
+    def test_parse_sqlglot_error(self, parser):
         # Trigger sqlglot.errors.ParseError
-        parser = UniversalParser()
         # This is invalid SQL, but the parser's fallback mechanism will split it by semicolon
         # and return it as a single, unparsed statement. It should not raise an error.
         queries = parser.parse("SELECT * FROM")  # Invalid SQL
@@ -1,12 +1,19 @@
+import html
 import io
 import json
+from dataclasses import dataclass
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from slowql.core.models import AnalysisResult, Dimension, Fix, Issue, Location, Severity, Statistics
 from slowql.reporters.json_reporter import (
+    _HTML_ESCAPE,
     CSVReporter,
     HTMLReporter,
     JSONReporter,
+    _issue_rows,
     _normalize_fix_text,
 )
 
@@ -25,6 +32,33 @@ class TestReportersCoverage:
         fix_desc_only = Fix("Desc", "")
         assert "Desc" in _normalize_fix_text(fix_desc_only)
 
+    def test_normalize_fix_text_unhashable_fix(self):
+        @dataclass
+        class PluginFix:
+            description: str
+            replacement: str
+
+        assert _normalize_fix_text(PluginFix("Desc", "Repl")) == "Desc Repl"
+        assert _normalize_fix_text(SimpleNamespace(description="Desc", replacement="")) == "Desc"
+
+    def test_issue_rows(self):
+        issue = Issue(
+            rule_id="RULE-1",
+            message="Msg",
+            severity=Severity.LOW,
+            dimension=Dimension.QUALITY,
+            location=Location(2, 4),
+            snippet="SELECT 1",
+            fix=Fix("Desc", "Repl"),
+        )
+        rows = list(_issue_rows([issue, issue]))
+        assert rows[0] == ("LOW", "RULE-1", "QUALITY", "Msg", "", "Desc Repl", str(Location(2, 4)))
+        assert rows[0] == rows[1]
+
+    def test_html_escape_table_matches_html_escape(self):
+        text = "<a href=\"x\">Tom & 'Jerry'</a> &amp;"
+        assert text.translate(_HTML_ESCAPE) == html.escape(text)
+
     def test_json_reporter(self):
         result = MagicMock(spec=AnalysisResult)
         result.to_dict.return_value = {"key": "val"}
@@ -74,6 +108,64 @@ class TestReportersCoverage:
             reporter.report(result)
             assert mock_print.called
 
+    def test_html_reporter_file_matches_stdout(self):
+        issues = [
+            Issue(
+                rule_id="RULE-<1>",
+                message="a & b",
+                severity=Severity.CRITICAL,
+                dimension=Dimension.SECURITY,
+                location=Location(3, 7),
+                snippet="SELECT 1",
+            )
+        ]
+        result = AnalysisResult(issues=issues, statistics=Statistics(total_issues=1), version="1.0")
+
+        with io.StringIO() as buf:
+            HTMLReporter(buf).report(result)
+            file_out = buf.getvalue()
+
+        with patch("builtins.print") as mock_print:
+            HTMLReporter().report(result)
+        assert mock_print.call_args.args[0] == file_out
+        assert "RULE-&lt;1&gt;" in file_out
+        assert '<td class="sev sev-critical">CRITICAL</td>' in file_out
+        assert file_out.rstrip().endswith("</html>")
+
+    def test_html_reporter_streams_rows(self):
+        issues = [
+            Issue(
+                rule_id=f"RULE-{i}",
+                message="Msg",
+                severity=Severity.LOW,
+                dimension=Dimension.QUALITY,
+                location=Location(1, 1),
+                snippet="SELECT 1",
+            )
+            for i in range(3)
+        ]
+        result = AnalysisResult(issues=issues, statistics=Statistics(total_issues=3), version="1.0")
+        pulled = []
+
+        def counting_rows(items):
+            for row in _issue_rows(items):
+                pulled.append(row[1])
+                yield row
+
+        class BrokenPipe(io.StringIO):
+            def write(self, s):
+                if "RULE-" in s:
+                    raise BrokenPipeError
+                return super().write(s)
+
+        with (
+            patch("slowql.reporters.json_reporter._issue_rows", counting_rows),
+            pytest.raises(BrokenPipeError),
+        ):
+            HTMLReporter(BrokenPipe()).report(result)
+        # The failed write stopped extraction after the first issue
+        assert pulled == ["RULE-0"]
+
     def test_csv_reporter(self):
         issues = [
             Issue(
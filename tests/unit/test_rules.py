@@ -171,6 +171,11 @@ from slowql.rules.catalog import (
 )
 from slowql.rules.registry import RuleRegistry, get_rule_registry
 
+# Oversized inputs for the threshold rules, built once at import
+_LARGE_IN_SQL = "SELECT * FROM users WHERE id IN (" + ",".join(map(str, range(1005))) + ")"
+_WIDE_SELECT_SQL = "SELECT " + ", ".join(f"col_{i}" for i in range(110)) + " FROM big_table"
+_MANY_JOINS_SQL = "SELECT * FROM t1 " + " ".join([f"JOIN t{i} ON 1" for i in range(2, 17)])
+
 
 def _make_query(sql: str, dialect: str = "mysql") -> Query:
     """Helper to create a Query object from raw SQL for pattern rule testing."""
@@ -494,6 +499,19 @@ class TestRuleRegistry:
         assert len(registry) == 0
         assert "TEST-SEC-001" not in registry
 
+    def test_unregister_uses_registered_index_keys(self):
+        """Test unregister cleans indices even if the rule was mutated after registration."""
+        registry = RuleRegistry()
+        rule = SecurityRuleHelper()
+        registry.register(rule)
+
+        rule.severity = Severity.LOW
+        registry.unregister("TEST-SEC-001")
+
+        assert registry.get_by_severity(Severity.HIGH) == []
+        assert registry.get_by_dimension(Dimension.SECURITY) == []
+        assert registry.stats()["by_severity"] == {}
+
     def test_unregister_nonexistent_rule(self):
         """Test unregistering a nonexistent rule."""
         registry = RuleRegistry()
@@ -532,6 +550,12 @@ class TestRuleRegistry:
         assert all_rules[0].id == "TEST-PERF-001"
         assert all_rules[1].id == "TEST-SEC-001"
 
+        # The memoized result is copied and invalidated on mutation
+        all_rules.clear()
+        assert len(registry.get_all()) == 2
+        registry.unregister("TEST-PERF-001")
+        assert [r.id for r in registry.get_all()] == ["TEST-SEC-001"]
+
     def test_get_by_dimension(self):
         """Test getting rules by dimension."""
         registry = RuleRegistry()
@@ -579,6 +603,32 @@ class TestRuleRegistry:
         assert len(medium_rules) == 1
         assert medium_rules[0].id == "TEST-PERF-001"
 
+    def test_get_by_indices_sorted(self):
+        """Test index lookups return rules sorted by ID regardless of insert order."""
+
+        class ZRule(PatternRule):
+            id = "SEC-Z-001"
+            dimension = Dimension.SECURITY
+            severity = Severity.HIGH
+            category = Category.SEC_INJECTION
+            pattern = r"z"
+
+        class ARule(PatternRule):
+            id = "SEC-A-001"
+            dimension = Dimension.SECURITY
+            severity = Severity.HIGH
+            category = Category.SEC_INJECTION
+            pattern = r"a"
+
+        registry = RuleRegistry()
+        registry.register(ZRule())
+        registry.register(ARule())
+
+        expected = ["SEC-A-001", "SEC-Z-001"]
+        assert [r.id for r in registry.get_by_dimension(Dimension.SECURITY)] == expected
+        assert [r.id for r in registry.get_by_category(Category.SEC_INJECTION)] == expected
+        assert [r.id for r in registry.get_by_severity(Severity.HIGH)] == expected
+
     def test_get_by_prefix(self):
         """Test getting rules by prefix."""
 
@@ -625,6 +675,63 @@ class TestRuleRegistry:
         assert len(enabled_rules) == 1
         assert enabled_rules[0].id == "TEST-SEC-001"
 
+    def test_set_enabled(self):
+        """Test toggling rules through the registry keeps get_enabled in sync."""
+        registry = RuleRegistry()
+        registry.register(SecurityRuleHelper())
+        registry.register(DisabledRuleHelper())
+        disabled_id = DisabledRuleHelper.id
+
+        registry.set_enabled(disabled_id, True)
+        assert [r.id for r in registry.get_enabled()] == sorted(["TEST-SEC-001", disabled_id])
+        assert registry.get(disabled_id).enabled is True
+
+        registry.set_enabled("TEST-SEC-001", False)
+        assert [r.id for r in registry.get_enabled()] == [disabled_id]
+
+        registry.unregister(disabled_id)
+        assert registry.get_enabled() == []
+
+        with pytest.raises(ValueError, match="not registered"):
+            registry.set_enabled("NONEXISTENT", True)
+
+    def test_stats_keys_follow_enum_order(self):
+        registry = RuleRegistry()
+        for rule in (DisabledRuleHelper(), PerformanceRuleHelper(), SecurityRuleHelper()):
+            registry.register(rule)
+
+        stats = registry.stats()
+        assert list(stats["by_dimension"]) == [
+            d.value
+            for d in Dimension
+            if d in (Dimension.SECURITY, Dimension.PERFORMANCE, Dimension.QUALITY)
+        ]
+        assert list(stats["by_severity"]) == [
+            s.value for s in Severity if s in (Severity.HIGH, Severity.MEDIUM, Severity.LOW)
+        ]
+
+    def test_enabled_readers_agree(self):
+        """Toggling via set_enabled or the rule's own flag is seen by every reader."""
+        registry = RuleRegistry()
+        rule = SecurityRuleHelper()
+        registry.register(rule)
+        registry.register(DisabledRuleHelper())
+
+        def readers():
+            return (
+                [r.id for r in registry.get_enabled()],
+                [r.id for r in registry.search("", enabled_only=True)],
+                registry.stats()["enabled"],
+            )
+
+        assert readers() == (["TEST-SEC-001"], ["TEST-SEC-001"], 1)
+
+        rule.enabled = False
+        assert readers() == ([], [], 0)
+
+        registry.set_enabled("TEST-SEC-001", True)
+        assert readers() == (["TEST-SEC-001"], ["TEST-SEC-001"], 1)
+
     def test_list_all(self):
         """Test listing all rules."""
         registry = RuleRegistry()
@@ -689,6 +796,30 @@ class TestRuleRegistry:
         assert "SEC-INJ-001" in rule_ids
         assert "PERF-IDX-001" in rule_ids
 
+    def test_search_text_follows_replace_and_unregister(self):
+        """Test precomputed search text is refreshed on replace and dropped on unregister."""
+
+        class Renamed(PatternRule):
+            id = "TEST-SEC-001"
+            name = "Renamed Rule"
+            description = "Completely different wording"
+            dimension = Dimension.SECURITY
+            severity = Severity.HIGH
+            pattern = r"x"
+
+        registry = RuleRegistry()
+        registry.register(SecurityRuleHelper())
+        assert [r.id for r in registry.search("test security")] == ["TEST-SEC-001"]
+
+        registry.register(Renamed(), replace=True)
+        assert registry.search("test security") == []
+        assert [r.id for r in registry.search("different wording")] == ["TEST-SEC-001"]
+        assert [r.id for r in registry.get_by_prefix("test-sec")] == ["TEST-SEC-001"]
+
+        registry.unregister("TEST-SEC-001")
+        assert registry.search("different") == []
+        assert registry.get_by_prefix("TEST") == []
+
     def test_stats(self):
         """Test getting registry statistics."""
         registry = RuleRegistry()
@@ -2257,8 +2388,7 @@ class TestLargeInClauseRule:
         self.rule = LargeInClauseRule()
 
     def test_large_in_clause(self):
-        in_list = ",".join(str(i) for i in range(1005))
-        assert self.rule.check(_make_query(f"SELECT * FROM users WHERE id IN ({in_list})"))
+        assert self.rule.check(_make_query(_LARGE_IN_SQL))
 
     def test_small_in_clause(self):
         assert not self.rule.check(_make_query("SELECT * FROM users WHERE id IN (1, 2, 3)"))
@@ -2434,8 +2564,7 @@ class TestExcessiveColumnCountRule:
         self.rule = ExcessiveColumnCountRule()
 
     def test_excessive_columns(self):
-        cols = ", ".join(f"col_{i}" for i in range(110))
-        assert self.rule.check(_make_query(f"SELECT {cols} FROM big_table"))
+        assert self.rule.check(_make_query(_WIDE_SELECT_SQL))
 
     def test_few_columns(self):
         assert not self.rule.check(_make_query("SELECT col_1, col_2 FROM table"))
@@ -3214,8 +3343,7 @@ class TestGodQueryRule:
 
     def test_too_many_joins(self):
         # 16 tables (15 joins) - should trigger (score: 15*2 = 30 > 25)
-        sql = "SELECT * FROM t1 " + " ".join([f"JOIN t{i} ON 1" for i in range(2, 17)])
-        assert self.rule.check(_make_query(sql))
+        assert self.rule.check(_make_query(_MANY_JOINS_SQL))
 
     def test_normal_joins(self):
         sql = "SELECT * FROM t1 JOIN t2 ON 1 JOIN t3 ON 1"
@@ -92,6 +92,8 @@ class TestRuleBase:
         p1 = rule._compile_pattern(pat)
         p2 = rule._compile_pattern(pat)
         assert p1 is p2
+        # The cache is shared across rule instances
+        assert ConcreteRule()._compile_pattern(pat) is p1
 
         # Test _has_pattern
         assert rule._has_pattern("select *", pat)
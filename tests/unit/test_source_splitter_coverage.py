@@ -1,13 +1,45 @@
+from unittest.mock import patch
+
+import pytest
+
 from slowql.parser.source_splitter import SourceSplitter
 
 
-def test_source_splitter_basic():
-    s = SourceSplitter()
-    sql = "SELECT 1; SELECT 2;"
-    slices = s.split(sql)
-    assert len(slices) == 2
-    assert slices[0].raw == "SELECT 1;"
-    assert slices[1].raw == "SELECT 2;"
+@pytest.mark.parametrize(
+    ("sql", "expected"),
+    [
+        ("", []),
+        ("   \n   ", []),
+        ("SELECT 1; SELECT 2;", ["SELECT 1;", "SELECT 2;"]),
+        (
+            "SELECT 'semi;colon' as a; SELECT \"another;semi\"; SELECT `back;tick`;",
+            ["SELECT 'semi;colon' as a;", 'SELECT "another;semi";', "SELECT `back;tick`;"],
+        ),
+        (
+            "SELECT 'it''s escaped;'; SELECT \"nested\"\"quotes;\";",
+            ["SELECT 'it''s escaped;';", 'SELECT "nested""quotes;";'],
+        ),
+        ("SELECT 'unclosed quote; still parses", ["SELECT 'unclosed quote; still parses"]),
+        ("SELECT 1;    \n   ", ["SELECT 1;"]),
+        ("BEGIN SELECT 1; END; SELECT 2;", ["BEGIN SELECT 1; END;", "SELECT 2;"]),
+        ("SELECT $$a;b$$; SELECT 2", ["SELECT $$a;b$$;", "SELECT 2"]),
+        ("SELECT 1 -- c;\n; SELECT /* ; */ 2;", ["SELECT 1 -- c;\n;", "SELECT /* ; */ 2;"]),
+    ],
+    ids=[
+        "empty",
+        "whitespace",
+        "basic",
+        "quotes",
+        "escaped_quotes",
+        "unclosed_quote",
+        "trailing_ws",
+        "block_keywords",
+        "dollar_quoted",
+        "comment_semicolons",
+    ],
+)
+def test_source_splitter_raw(sql, expected):
+    assert [sl.raw for sl in SourceSplitter().split(sql)] == expected
 
 def test_source_splitter_comments():
     s = SourceSplitter()
@@ -23,15 +55,6 @@ def test_source_splitter_comments():
     assert "SELECT 1;" in slices[0].raw
     assert "SELECT 2;" in slices[1].raw
 
-def test_source_splitter_quotes():
-    s = SourceSplitter()
-    sql = "SELECT 'semi;colon' as a; SELECT \"another;semi\"; SELECT `back;tick`;"
-    slices = s.split(sql)
-    assert len(slices) == 3
-    assert slices[0].raw == "SELECT 'semi;colon' as a;"
-    assert slices[1].raw == "SELECT \"another;semi\";"
-    assert slices[2].raw == "SELECT `back;tick`;"
-
 def test_source_splitter_line_col():
     s = SourceSplitter()
     sql = "SELECT 1;\nSELECT 2;"
@@ -41,29 +64,22 @@ def test_source_splitter_line_col():
     assert slices[1].line == 2
     assert slices[1].column == 1
 
-def test_source_splitter_empty():
+def test_source_splitter_line_col_multiline_gaps():
     s = SourceSplitter()
-    assert s.split("") == []
-    assert s.split("   \n   ") == []
-
-def test_source_splitter_escaped_quotes():
-    s = SourceSplitter()
-    sql = "SELECT 'it''s escaped;'; SELECT \"nested\"\"quotes;\";"
-    slices = s.split(sql)
-    assert len(slices) == 2
-    assert slices[0].raw == "SELECT 'it''s escaped;';"
-    assert slices[1].raw == "SELECT \"nested\"\"quotes;\";"
-
-def test_source_splitter_unclosed_quotes():
-    s = SourceSplitter()
-    sql = "SELECT 'unclosed quote; still parses"
+    sql = "  SELECT 1;\n\n-- note\n   SELECT\n 2; /* c\n */ SELECT 3;"
     slices = s.split(sql)
-    assert len(slices) == 1
-    assert slices[0].raw == "SELECT 'unclosed quote; still parses"
+    assert [(sl.line, sl.column) for sl in slices] == [(1, 3), (4, 4), (6, 5)]
+    for sl in slices:
+        assert sql[sl.start_offset:sl.end_offset] == sl.raw
 
-def test_source_splitter_trailing_whitespace():
+def test_source_splitter_no_semicolon_fast_path():
     s = SourceSplitter()
-    sql = "SELECT 1;    \n   "
-    slices = s.split(sql)
+    sql = "\n  -- header\n  SELECT CASE WHEN a THEN 1 END\n  FROM t  \n"
+    with patch.object(SourceSplitter, "_find_statement_end") as mock_end:
+        slices = s.split(sql)
+    mock_end.assert_not_called()
     assert len(slices) == 1
-    assert slices[0].raw == "SELECT 1;"
+    assert slices[0].raw == "SELECT CASE WHEN a THEN 1 END\n  FROM t"
+    assert (slices[0].line, slices[0].column) == (3, 3)
+    assert sql[slices[0].start_offset:slices[0].end_offset] == slices[0].raw
+    assert s.split("  -- only a comment\n") == []